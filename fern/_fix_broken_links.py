@@ -25,7 +25,6 @@ REPLACEMENTS: list[tuple[str, str]] = [
     # Legacy /docs/* → Fern paths
     ("/docs/reference/infrastructure/container/environments", "/reference/infra/container-environments"),
     ("/docs/reference/execution/backends", "/reference/infra/execution-backends"),
-    ("/docs/reference/execution/backends", "/reference/infra/execution-backends"),
     ("/docs/admin/deployment/requirements", "/admin/deployment/requirements"),
     ("/docs/get-started/text", "/get-started/text"),
     ("/docs/get-started/image", "/get-started/image"),
@@ -139,6 +138,12 @@ REPLACEMENTS.sort(key=lambda x: -len(x[0]))
 
 APIDOC_BASE = "https://docs.nvidia.com/nemo/curator/latest/apidocs"
 
+# Compiled once; fix_file runs these over every MDX file
+_APIDOC_DQ_RE = re.compile(r'"/\.\./apidocs/([^"]+)"')
+_APIDOC_SQ_RE = re.compile(r"'/\.\./apidocs/([^']+)'")
+_CURATE_REL_RE = re.compile(r'(\]\(|href=")(curate-[a-z-]+/[^")\s]+)')
+_ABOUT_REL_RE = re.compile(r'(\]\(|href=")(about/concepts/[^")\s]+)')
+
 
 def fix_file(path: Path) -> bool:
     text = path.read_text(encoding="utf-8")
@@ -152,21 +157,13 @@ def fix_file(path: Path) -> bool:
         rest = m.group(1).lstrip("/")
         return f'"{APIDOC_BASE}/{rest}"'
 
-    text = re.sub(r'"/\.\./apidocs/([^"]+)"', apidoc_repl, text)
-    text = re.sub(r"'/\.\./apidocs/([^']+)'", lambda m: f"'{APIDOC_BASE}/{m.group(1).lstrip('/')}'", text)
+    text = _APIDOC_DQ_RE.sub(apidoc_repl, text)
+    text = _APIDOC_SQ_RE.sub(lambda m: f"'{APIDOC_BASE}/{m.group(1).lstrip('/')}'", text)
 
     # Leading-slashless curate-* paths in href or ](
-    text = re.sub(
-        r'(\]\(|href=")(curate-[a-z-]+/[^")\s]+)',
-        lambda m: m.group(1) + "/" + m.group(2),
-        text,
-    )
+    text = _CURATE_REL_RE.sub(lambda m: m.group(1) + "/" + m.group(2), text)
     # about/ without leading slash (not already fixed)
-    text = re.sub(
-        r'(\]\(|href=")(about/concepts/[^")\s]+)',
-        lambda m: m.group(1) + "/" + m.group(2),
-        text,
-    )
+    text = _ABOUT_REL_RE.sub(lambda m: m.group(1) + "/" + m.group(2), text)
 
     if text != orig:
         path.write_text(text, encoding="utf-8")
@@ -23,6 +23,7 @@ Usage (from repo root)::
 """
 
 import argparse
+import functools
 import re
 from pathlib import Path
 
@@ -43,12 +44,21 @@ DEFAULT_VARIABLES = {
 }
 
 
+@functools.cache
+def _variable_pattern(names: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one alternation matching ``{{ name }}`` for any of ``names``."""
+    alternation = "|".join(re.escape(name) for name in names)
+    # Handle both {{ var }} and {{var}} patterns
+    return re.compile(rf"{{{{\s*({alternation})\s*}}}}")
+
+
 def substitute_variables(content: str, variables: dict) -> str:
     """Replace {{ variable }} patterns with their values."""
-    for var, value in variables.items():
-        # Handle both {{ var }} and {{var}} patterns
-        content = re.sub(rf"{{\{{\s*{var}\s*}}}}", value, content)
-    return content
+    # Most pages carry no variables; skip the regex scan for them
+    if not variables or "{{" not in content:
+        return content
+    pattern = _variable_pattern(tuple(variables))
+    return pattern.sub(lambda m: variables[m.group(1)], content)
 
 
 def process_file(filepath: Path, variables: dict, dry_run: bool = False) -> bool:
@@ -0,0 +1,37 @@
+# Copyright (c) 2026, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "fern"))
+
+from substitute_variables import substitute_variables
+
+
+@pytest.mark.parametrize("content", ["{{ }}", "{{}}", "{{ version }}", "no variables here"])
+def test_empty_variables_is_noop(content: str):
+    assert substitute_variables(content, {}) == content
+
+
+def test_substitutes_spaced_and_unspaced_patterns():
+    variables = {"product_name": "NeMo Curator", "product_name_short": "Curator"}
+    content = "{{ product_name }} / {{product_name_short}} / {{ unknown }}"
+    assert substitute_variables(content, variables) == "NeMo Curator / Curator / {{ unknown }}"
+
+
+def test_values_are_inserted_literally():
+    assert substitute_variables("{{ version }}", {"version": r"\g<0>\n"}) == r"\g<0>\n"